@@ -1,6 +1,14 @@
 """Robotic arm control package."""
 
 from robotic_arm.serial_controller import ArmStatus, RoboticArmController, setup_logging
-from robotic_arm.visualizer import ArmVisualizerApp
 
 __all__ = ["ArmStatus", "RoboticArmController", "setup_logging", "ArmVisualizerApp"]
+
+
+def __getattr__(name: str):
+    # The visualizer pulls in Tk and matplotlib; only load it when asked for.
+    if name == "ArmVisualizerApp":
+        from robotic_arm.visualizer import ArmVisualizerApp
+
+        return ArmVisualizerApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,7 +12,7 @@ import logging
 import threading
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 import serial
 
@@ -40,7 +40,10 @@ class RoboticArmController:
 
     After initialization, ``start_coordinate_monitor`` can be used to
     refresh coordinates continuously so operators can see real-time
-    pose updates.
+    pose updates. ``on_coordinates`` is called with the raw T06 reply
+    whenever it differs from the previous one, so consumers can react to
+    pose changes instead of polling :attr:`status`. If a poll fails the
+    monitor stops and ``on_error`` is called with the exception.
     """
 
     def __init__(
@@ -49,14 +52,25 @@ class RoboticArmController:
         baudrate: int = 115_200,
         read_timeout: float = 1.0,
         coordinate_interval: float = 1.0,
+        on_coordinates: Optional[Callable[[bytes], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
     ) -> None:
         self.port = port
         self.baudrate = baudrate
         self.read_timeout = read_timeout
         self.coordinate_interval = coordinate_interval
+        self.on_coordinates = on_coordinates
+        self.on_error = on_error
+        self._last_coords: Optional[bytes] = None
         self._serial: Optional[serial.Serial] = None
         self._monitor_thread: Optional[threading.Thread] = None
         self._monitor_stop = threading.Event()
+        # Wakes the monitor between polls, for stop requests and out-of-cycle reads.
+        self._monitor_wake = threading.Event()
+        # Serializes request/response pairs between the monitor and callers.
+        self._io_lock = threading.Lock()
+        # Receive buffer reused across reads; holds any bytes past the last newline.
+        self._rx_buf = bytearray()
         self.status = ArmStatus()
 
     def connect(self) -> None:
@@ -73,15 +87,33 @@ class RoboticArmController:
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE,
             timeout=self.read_timeout,
+            inter_byte_timeout=None,
         )
+        self._enable_low_latency()
         # Clear any boot-time noise so the first read belongs to our first command.
         self._serial.reset_input_buffer()
+        self._rx_buf.clear()
         _LOGGER.debug("Serial connection ready: %s", self._serial)
 
+    def _enable_low_latency(self) -> None:
+        # FT232R adapters hold received bytes for up to 16 ms before passing
+        # them on; ASYNC_LOW_LATENCY makes the Linux driver drop that to 1 ms.
+        # pyserial defines the method on every POSIX port but only Linux
+        # implements it (and Windows lacks it), so other platforms keep the
+        # driver default.
+        set_low_latency = getattr(self._serial, "set_low_latency_mode", None)
+        if set_low_latency is None:
+            return
+        try:
+            set_low_latency(True)
+        except (NotImplementedError, ValueError, OSError) as exc:
+            _LOGGER.debug("Low-latency mode unavailable on %s: %s", self.port, exc)
+
     def close(self) -> None:
         """Close the serial port and stop background monitoring."""
 
         self._monitor_stop.set()
+        self._monitor_wake.set()
         if self._monitor_thread and self._monitor_thread.is_alive():
             self._monitor_thread.join(timeout=2)
         if self._serial and self._serial.is_open:
@@ -94,28 +126,97 @@ class RoboticArmController:
         Some motions (e.g., ``G29`` startup) may take longer than the
         default serial timeout to acknowledge. ``response_timeout`` allows
         callers to override the wait window for a single command while
-        continuing to poll the port until a non-empty line arrives.
+        continuing to read until a non-empty line arrives; blank lines
+        within the window are skipped.
+        """
+
+        response = self.send_command_bytes(command.encode("ascii"), response_timeout=response_timeout)
+        return response.decode("ascii", errors="ignore")
+
+    def send_command_bytes(self, command: bytes, *, response_timeout: Optional[float] = None) -> bytes:
+        """Byte-level variant of :meth:`send_command`.
+
+        Returns the stripped response without decoding it, which keeps the
+        periodic T06 path free of intermediate ``str`` objects.
+
+        The write and the matching read happen under a lock so commands
+        issued while the coordinate monitor is running never receive the
+        monitor's T06 reply (or vice versa).
         """
 
         if not self._serial or not self._serial.is_open:
             raise RuntimeError("Serial port is not open; call connect() first.")
 
-        if not command.endswith("\n"):
-            command += "\n"
-        _LOGGER.debug("--> %s", command.strip())
-        self._serial.write(command.encode("ascii"))
-        self._serial.flush()
-
-        deadline = time.time() + (response_timeout or self.read_timeout)
-        response = ""
-        while time.time() < deadline:
-            response = self._serial.readline().decode("ascii", errors="ignore").strip()
-            if response:
-                _LOGGER.debug("<-- %s", response)
-                return response
-            _LOGGER.debug("<-- (no data yet, waiting for response)")
+        if not command.endswith(b"\n"):
+            command += b"\n"
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("--> %s", command.decode("ascii", errors="ignore").strip())
+        with self._io_lock:
+            self._serial.write(command)
+            self._serial.flush()
+
+            response = self._read_reply(response_timeout or self.read_timeout)
+
+        if not response:
+            raise RuntimeError("No response received from robotic arm.")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("<-- %s", response.decode("ascii", errors="ignore"))
+        return response
+
+    def _read_reply(self, window: float) -> bytes:
+        """Return the first non-empty stripped line received within ``window`` seconds.
+
+        Blank lines (e.g. a bare ``\\r\\n`` ahead of ``OK`` during G29) are
+        skipped so the real reply is not left behind for the next command.
+        Returns ``b""`` if nothing but blank lines arrived. Callers must hold
+        :attr:`_io_lock`.
+        """
+
+        deadline = time.monotonic() + window
+        # Assigning Serial.timeout reconfigures the port (SetCommTimeouts et al.
+        # on Windows), so only touch it for windows other than the default.
+        previous_timeout = self._serial.timeout
+        if window != previous_timeout:
+            self._serial.timeout = window
+        try:
+            while True:
+                raw = self._read_line(deadline)
+                line = raw.strip()
+                # An empty read means the deadline passed with nothing received.
+                if line or not raw or time.monotonic() >= deadline:
+                    return line
+        finally:
+            if window != previous_timeout:
+                self._serial.timeout = previous_timeout
+
+    def _read_line(self, deadline: float) -> bytes:
+        """Read one line, giving up once ``time.monotonic()`` reaches ``deadline``.
+
+        ``Serial.read_until`` issues one ``read(1)`` per byte; here the first
+        read blocks for data and the rest of the OS buffer is drained in one
+        call into :attr:`_rx_buf`. No read starts once the deadline has
+        passed, but a blocking read started just before it may run for one
+        more port timeout. On timeout any partial line is returned as-is; its
+        tail may still arrive later and be read as the next command's reply.
+        Callers must hold :attr:`_io_lock`.
+        """
 
-        raise RuntimeError("No response received from robotic arm.")
+        buf = self._rx_buf
+        while True:
+            end = buf.find(b"\n")
+            if end >= 0:
+                line = bytes(buf[: end + 1])
+                del buf[: end + 1]
+                return line
+            chunk = b""
+            if time.monotonic() < deadline:
+                chunk = self._serial.read(self._serial.in_waiting or 1)
+            if not chunk:
+                # Timed out: hand back whatever partial data arrived.
+                line = bytes(buf)
+                buf.clear()
+                return line
+            buf += chunk
 
     def initialize(self) -> ArmStatus:
         """Run the startup sequence and return the populated status."""
@@ -129,23 +230,39 @@ class RoboticArmController:
         if not self._serial or not self._serial.is_open:
             self.connect()
 
+    def _send_pipeline(self, commands: list[str]) -> list[str]:
+        """Write several commands at once and collect one reply line per command.
+
+        The firmware answers strictly in order, so the commands can share a
+        single write/flush instead of paying a round trip each.
+        """
+
+        if not self._serial or not self._serial.is_open:
+            raise RuntimeError("Serial port is not open; call connect() first.")
+
+        _LOGGER.debug("--> %s", " | ".join(commands))
+        payload = ("\n".join(commands) + "\n").encode("ascii")
+        responses = []
+        with self._io_lock:
+            self._serial.write(payload)
+            self._serial.flush()
+            for _ in commands:
+                response = self._read_reply(self.read_timeout).decode("ascii", errors="ignore")
+                if not response:
+                    raise RuntimeError("No response received from robotic arm.")
+                _LOGGER.debug("<-- %s", response)
+                responses.append(response)
+        return responses
+
     def _query_identity(self) -> None:
-        # T01: keep-alive
-        response = self.send_command("T01")
-        if response != "T01":
-            raise RuntimeError(f"Unexpected T01 response: {response}")
-
-        # T02: serial number
-        response = self.send_command("T02")
-        if not response.startswith("T02 "):
-            raise RuntimeError(f"Unexpected T02 response: {response}")
-        self.status.serial_number = response.removeprefix("T02 ")
-
-        # T03: firmware version
-        response = self.send_command("T03")
-        if not response.startswith("T03 "):
-            raise RuntimeError(f"Unexpected T03 response: {response}")
-        self.status.firmware_version = response.removeprefix("T03 ")
+        # T01: keep-alive, T02: serial number, T03: firmware version
+        keep_alive, serial_number, firmware = self._send_pipeline(["T01", "T02", "T03"])
+
+        if keep_alive != "T01":
+            raise RuntimeError(f"Unexpected T01 response: {keep_alive}")
+
+        self.status.serial_number = _reply_payload(serial_number, "T02")
+        self.status.firmware_version = _reply_payload(firmware, "T03")
 
     def _move_to_startup_position(self) -> None:
         response = self.send_command("G29", response_timeout=10.0)
@@ -153,22 +270,54 @@ class RoboticArmController:
             raise RuntimeError(f"Startup (G29) failed: {response}")
         _LOGGER.info("Robot moved to startup position via G29")
 
+    def refresh_coordinates(self) -> str:
+        """Query T06 once and store the reply in :attr:`status`."""
+
+        raw = self.send_command_bytes(b"T06")
+        coordinates = raw.decode("ascii", errors="ignore")
+        self.status.coordinates = coordinates
+        if raw != self._last_coords:
+            self._last_coords = raw
+            if self.on_coordinates is not None:
+                self.on_coordinates(raw)
+        return coordinates
+
     def start_coordinate_monitor(self) -> None:
         """Start a background thread that polls T06 for coordinates."""
 
         if self._monitor_thread and self._monitor_thread.is_alive():
             return
         self._monitor_stop.clear()
+        self._monitor_wake.clear()
+        self._last_coords = None
         self._monitor_thread = threading.Thread(
             target=self._monitor_coordinates, name="arm-coordinate-monitor", daemon=True
         )
         self._monitor_thread.start()
 
+    def request_coordinate_refresh(self) -> bool:
+        """Ask the running monitor for an immediate T06 read.
+
+        The reply is passed to :attr:`on_coordinates` even if the pose has not
+        changed. Returns ``False`` when no monitor is running; callers then
+        have to query the arm themselves (e.g. via :meth:`refresh_coordinates`).
+        """
+
+        # A monitor that has hit an error sets the stop flag before reporting it.
+        if self._monitor_stop.is_set() or not (self._monitor_thread and self._monitor_thread.is_alive()):
+            return False
+        self._last_coords = None
+        self._monitor_wake.set()
+        return True
+
     def _monitor_coordinates(self) -> None:
+        # Polls are scheduled on a fixed grid (start + k * interval) so the
+        # serial round trip does not stretch the period.
+        interval = self.coordinate_interval
+        start = time.monotonic()
         while not self._monitor_stop.is_set():
             try:
-                coordinates = self.send_command("T06")
-                self.status.coordinates = coordinates
+                coordinates = self.refresh_coordinates()
                 _LOGGER.info("Coordinates: %s", coordinates)
             except Exception as exc:  # pylint: disable=broad-except
                 _LOGGER.error("Coordinate refresh failed: %s", exc)
@@ -176,13 +325,25 @@ class RoboticArmController:
                     "If communication was interrupted, reset the controller and re-run initialization."
                 )
                 self._monitor_stop.set()
+                if self.on_error is not None:
+                    self.on_error(exc)
                 break
-            time.sleep(self.coordinate_interval)
+            # Wait for the next slot after now. Slots missed while a long
+            # command held the port are skipped rather than replayed, and an
+            # out-of-cycle read does not shift the grid.
+            residual = 0.0
+            if interval > 0:
+                tick = int((time.monotonic() - start) // interval) + 1
+                residual = start + tick * interval - time.monotonic()
+            # Returns early on stop_coordinate_monitor() or request_coordinate_refresh().
+            self._monitor_wake.wait(residual)
+            self._monitor_wake.clear()
 
     def stop_coordinate_monitor(self) -> None:
         """Stop background coordinate monitoring."""
 
         self._monitor_stop.set()
+        self._monitor_wake.set()
         if self._monitor_thread and self._monitor_thread.is_alive():
             self._monitor_thread.join(timeout=2)
 
@@ -195,6 +356,15 @@ class RoboticArmController:
             self.close()
 
 
+def _reply_payload(response: str, command: str) -> str:
+    """Return the text after ``"<command> "`` or raise if the echo is missing."""
+
+    prefix = command + " "
+    if not response.startswith(prefix):
+        raise RuntimeError(f"Unexpected {command} response: {response}")
+    return response[len(prefix) :]
+
+
 def setup_logging(verbose: bool = False) -> None:
     """Configure log output for command-line usage."""
 
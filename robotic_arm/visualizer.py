@@ -3,28 +3,67 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import queue
+import re
 import sys
 import threading
 import tkinter as tk
+from math import atan2, cos, radians, sin, sqrt
 from tkinter import messagebox
-from typing import Iterable
+from typing import Callable, Iterable
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+import numpy as np
 
 from robotic_arm.serial_controller import RoboticArmController, setup_logging
 
+# Usual T06 layout ("X.. Y.. Z.. RX.. RY.. RZ.."), parsed in a single match.
+_FAST_COORD_RE = re.compile(
+    rb"(?<!\S)X(-?\d+\.?\d*)\s+Y(-?\d+\.?\d*)\s+Z(-?\d+\.?\d*)"
+    rb"\s+RX(-?\d+\.?\d*)\s+RY(-?\d+\.?\d*)\s+RZ(-?\d+\.?\d*)(?!\S)"
+)
+# Fallback tokenizer dispatch: two-byte rotation prefixes map onto A/B/C,
+# otherwise the first byte (as an int) names the axis.
+_ROTATION_KEYS = {b"RX": "A", b"RY": "B", b"RZ": "C"}
+_AXIS_KEYS = {ord(axis): axis for axis in "XYZABC"}
+
+_AXES = ("X", "Y", "Z", "A", "B", "C")
+# " X", " Y", ... pre-encoded for building motion commands directly as bytes.
+_AXIS_PREFIXES = tuple(f" {axis}".encode("ascii") for axis in _AXES)
+
+_PREVIEW_STEPS = 15
+# Tk-side poll period for readings handed over by the monitor thread.
+_DRAIN_INTERVAL_MS = 50
+
+# Nominal link lengths (mm) measured from the home pose.
+_LINK_LENGTHS = (140.0, 140.0, 100.0)
+# Max reach from base to tool center in any direction (mm).
+_MAX_REACH = sum(_LINK_LENGTHS)
+# Startup position derived from the vertical 90° posture.
+_HOME_POSE = (0.0, 0.0, _MAX_REACH)
+_REACH_SQ = _MAX_REACH * _MAX_REACH
+
 
 class ArmVisualizerApp:
     """Interactive 3D visualizer that can drive the robotic arm."""
 
-    def __init__(self, controller: RoboticArmController, refresh_ms: int = 500) -> None:
+    def __init__(self, controller: RoboticArmController, *, dpi: int = 72) -> None:
         self.controller = controller
-        self.refresh_ms = refresh_ms
+        # Agg rasterizes figsize * dpi pixels on every full render.
+        self.dpi = dpi
         self._running = False
-        self._target_pose: tuple[float, float, float] | None = None
+        # Last target sent to the arm; status refreshes reuse it instead of re-reading the entries.
+        self._target_pose: tuple[float, float, float] = (0.0, 0.0, 0.0)
         self._last_pose: dict[str, float] | None = None
-        self._home_pose = _home_pose()
+        # Monitor thread -> Tk handoff. The worker only puts; the Tk loop polls
+        # the queue so no Tcl call is ever made off the main thread.
+        self._coord_queue: queue.SimpleQueue[bytes] = queue.SimpleQueue()
+        # Other worker -> Tk messages (init result, monitor failure), as
+        # (callback, args) pairs run by _drain_coordinates.
+        self._ui_calls: queue.SimpleQueue[tuple[Callable[..., None], tuple]] = queue.SimpleQueue()
+        self._preview_job: str | None = None
+        # Set by the Refresh button; the next pushed reading fills the response label.
+        self._refresh_requested = False
 
         self.root = tk.Tk()
         self.root.title("Robotic Arm Visualizer")
@@ -46,16 +85,17 @@ class ArmVisualizerApp:
 
         tk.Label(controls, text="Target coordinates").grid(row=0, column=0, columnspan=2, sticky="w")
 
-        self._entries: dict[str, tk.Entry] = {}
-        labels = ["X", "Y", "Z", "A", "B", "C"]
-        for idx, name in enumerate(labels, start=1):
+        # Each entry is bound to a DoubleVar, so a move reads ready-made floats.
+        self._vars: dict[str, tk.DoubleVar] = {}
+        validate = (self.root.register(self._validate_entry), "%P", "%W")
+        for idx, name in enumerate(_AXES, start=1):
             tk.Label(controls, text=name).grid(row=idx, column=0, sticky="e", pady=2)
-            entry = tk.Entry(controls, width=12)
-            entry.insert(0, "0")
+            var = tk.DoubleVar(value=0.0)
+            entry = tk.Entry(controls, width=12, textvariable=var, validate="focusout", validatecommand=validate)
             entry.grid(row=idx, column=1, sticky="w", pady=2)
-            self._entries[name] = entry
+            self._vars[name] = var
 
-        button_row = len(labels) + 1
+        button_row = len(_AXES) + 1
         tk.Button(controls, text="Move (G01)", command=self._move_linear).grid(
             row=button_row, column=0, columnspan=2, sticky="ew", pady=(8, 2)
         )
@@ -76,69 +116,155 @@ class ArmVisualizerApp:
             row=button_row + 5, column=0, columnspan=2, sticky="w"
         )
 
+    def _validate_entry(self, text: str, widget_name: str) -> bool:
+        # Flag non-numeric input as soon as the entry loses focus.
+        try:
+            float(text)
+            valid = True
+        except ValueError:
+            valid = False
+        self.root.nametowidget(widget_name).config(fg="black" if valid else "red")
+        return True
+
     def _build_plot(self) -> None:
+        # Imported here so matplotlib is only loaded once a window is built.
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
         plot_frame = tk.Frame(self.root)
         plot_frame.pack(side="right", fill="both", expand=True, padx=8, pady=8)
 
-        figure = Figure(figsize=(6, 6))
+        figure = Figure(figsize=(6, 6), dpi=self.dpi)
         self._ax = figure.add_subplot(111, projection="3d")
         self._configure_axes()
-        self._current_point = None
-        self._target_point = None
+
+        # Persistent artists: _draw_points only moves them instead of rebuilding the axes.
+        # They are animated, i.e. left out of full redraws and blitted over a cached background.
+        home = _HOME_POSE
+        (self._arm_line,) = self._ax.plot(
+            [0, 0], [0, 0], [0, 0], "-o", c="tab:blue", label="Arm", animated=True
+        )
+        self._current_point = self._ax.scatter(*home, c="tab:blue", s=80, animated=True)
+        self._target_point = self._ax.scatter(*home, c="tab:orange", s=80, label="Target", animated=True)
+        (self._target_line,) = self._ax.plot([0, 0], [0, 0], [0, 0], "k--", alpha=0.3, animated=True)
+        self._tool_axis = Line3DCollection(
+            _tool_axis_segments(home, (0.0, 0.0, 1.0)), colors="tab:green", label="Tool axis", animated=True
+        )
+        self._ax.add_collection3d(self._tool_axis)
+
+        # Reference: home pose along the vertical plane through the base
+        self._ax.scatter(*home, c="gray", s=50, alpha=0.7, label="Home")
+        self._ax.plot([0, home[0]], [0, home[1]], [0, home[2]], "gray", alpha=0.3)
 
         canvas = FigureCanvasTkAgg(figure, master=plot_frame)
         canvas.get_tk_widget().pack(fill="both", expand=True)
         self._canvas = canvas
-        self._draw_points(self._home_pose, self._home_pose, {})
+        self._background = None
+        self._dirty = False
+        # Every full redraw (first show, resize, mouse rotation) refreshes the background.
+        canvas.mpl_connect("draw_event", self._on_canvas_draw)
+
+        # Bound once so the redraw path skips the attribute chains.
+        self._set_arm_data = self._arm_line.set_data_3d
+        self._set_target_line = self._target_line.set_data_3d
+        self._draw_artist = self._ax.draw_artist
+        self._joints_buf = np.zeros((4, 3))
+
+        self._draw_points(_HOME_POSE, _HOME_POSE, {})
+        # Labels never change, so the legend is built once the tool axis exists.
+        self._ax.legend(loc="upper right")
+        # Prime the renderer so the first blit has a background to restore.
+        canvas.draw()
 
     def run(self) -> None:
         self._running = True
         self._status_label.config(text="Initializing robot…")
 
+        self.root.after(_DRAIN_INTERVAL_MS, self._drain_coordinates)
         thread = threading.Thread(target=self._initialize_robot, daemon=True)
         thread.start()
         self.root.mainloop()
 
     def _initialize_robot(self) -> None:
+        # Runs on a worker thread: results go through _ui_calls so only the Tk
+        # thread touches Tcl, even if the window is closed mid-initialization.
         try:
             status = self.controller.initialize()
+            self.controller.on_coordinates = self._on_coordinates
+            self.controller.on_error = self._on_monitor_error
             self.controller.start_coordinate_monitor()
             status_text = f"Serial: {status.serial_number or '?'} | Firmware: {status.firmware_version or '?'}"
-            self._set_status(status_text)
-            self._schedule_update()
+            self._ui_calls.put_nowait((self._set_status, (status_text,)))
         except Exception as exc:  # pylint: disable=broad-except
-            self._set_status(f"Initialization failed: {exc}")
-            messagebox.showerror("Initialization failed", str(exc))
+            if self._running:
+                self._ui_calls.put_nowait((self._report_init_failure, (str(exc),)))
+
+    def _report_init_failure(self, message: str) -> None:
+        self._set_status(f"Initialization failed: {message}")
+        messagebox.showerror("Initialization failed", message)
 
     def _set_status(self, text: str) -> None:
         self._status_label.config(text=text)
         self._status_text.set(text)
 
-    def _schedule_update(self) -> None:
+    def _on_coordinates(self, coordinates: bytes) -> None:
+        # Called from the monitor thread; _drain_coordinates picks it up.
+        if self._running:
+            self._coord_queue.put_nowait(coordinates)
+
+    def _on_monitor_error(self, exc: Exception) -> None:
+        # Called from the monitor thread just before it exits.
+        if self._running:
+            self._ui_calls.put_nowait((self._report_monitor_error, (str(exc),)))
+
+    def _report_monitor_error(self, message: str) -> None:
+        self._refresh_requested = False
+        self._response_text.set(f"Error: {message}")
+        self._set_status(f"Coordinate monitor stopped: {message}")
+
+    def _drain_coordinates(self) -> None:
         if not self._running:
             return
-        self._update_from_status()
-        self.root.after(self.refresh_ms, self._schedule_update)
-
-    def _update_from_status(self) -> None:
-        coordinates = self.controller.status.coordinates
-        if not coordinates:
+        self.root.after(_DRAIN_INTERVAL_MS, self._drain_coordinates)
+        while True:
+            try:
+                callback, args = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            callback(*args)
+        latest = None
+        while True:
+            try:
+                latest = self._coord_queue.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None:
+            self._update_from_status(latest)
+
+    def _update_from_status(self, coordinates: bytes) -> None:
+        if not self._running:
             return
+        if self._refresh_requested:
+            self._refresh_requested = False
+            self._response_text.set(coordinates.decode("ascii", errors="ignore"))
         parsed = _parse_coordinate_line(coordinates)
         if not parsed:
             return
         self._last_pose = parsed
-        x, y, z = parsed.get("X", 0.0), parsed.get("Y", 0.0), parsed.get("Z", 0.0)
-        target = self._target_pose or self._read_target()
-        self._draw_points((x, y, z), target, parsed)
-        pretty = _format_pose(parsed, target)
+        self._draw_pose(parsed)
+        pretty = _format_pose(parsed, self._target_pose)
         self._status_text.set(pretty)
 
+    def _draw_pose(self, pose: dict[str, float]) -> None:
+        x, y, z = pose.get("X", 0.0), pose.get("Y", 0.0), pose.get("Z", 0.0)
+        self._draw_points((x, y, z), self._target_pose, pose)
+
     def _configure_axes(self) -> None:
         self._ax.set_xlabel("X")
         self._ax.set_ylabel("Y")
         self._ax.set_zlabel("Z")
-        reach = _max_reach()
+        reach = _MAX_REACH
         self._ax.set_xlim(-reach, reach)
         self._ax.set_ylim(-reach, reach)
         self._ax.set_zlim(0, reach * 1.1)
@@ -151,53 +277,53 @@ class ArmVisualizerApp:
         target: tuple[float, float, float],
         pose: dict[str, float],
     ) -> None:
-        self._ax.cla()
-        self._configure_axes()
-
-        joints = _solve_simple_arm(current, pose)
-        xs, ys, zs = zip(*joints)
-        self._ax.plot(xs, ys, zs, "-o", c="tab:blue", label="Arm")
-        self._ax.scatter(*current, c="tab:blue", s=80)
-
-        self._ax.scatter(*target, c="tab:orange", s=80, label="Target")
-        self._ax.plot([current[0], target[0]], [current[1], target[1]], [current[2], target[2]], "k--", alpha=0.3)
-
-        # Reference: home pose along the vertical plane through the base
-        self._ax.scatter(*self._home_pose, c="gray", s=50, alpha=0.7, label="Home")
-        self._ax.plot([0, self._home_pose[0]], [0, self._home_pose[1]], [0, self._home_pose[2]], "gray", alpha=0.3)
-
-        orient_vec = _orientation_vector(pose)
-        end = current
-        self._ax.quiver(
-            end[0],
-            end[1],
-            end[2],
-            orient_vec[0],
-            orient_vec[1],
-            orient_vec[2],
-            length=60,
-            normalize=True,
-            color="tab:green",
-            label="Tool axis",
-        )
-
-        self._ax.legend(loc="upper right")
-        self._canvas.draw()
-
-    def _read_target(self) -> tuple[float, float, float]:
-        try:
-            return (
-                float(self._entries["X"].get()),
-                float(self._entries["Y"].get()),
-                float(self._entries["Z"].get()),
-            )
-        except ValueError:
-            return 0.0, 0.0, 0.0
+        sin_yaw, cos_yaw = _yaw_terms(pose.get("C", 0.0))
+        joints = _solve_simple_arm(current, sin_yaw, cos_yaw, self._joints_buf)
+        # Column views of the reused buffer: no per-frame tuples for the arm line.
+        self._set_arm_data(joints[:, 0], joints[:, 1], joints[:, 2])
+        self._current_point._offsets3d = ([current[0]], [current[1]], [current[2]])
+
+        self._target_point._offsets3d = ([target[0]], [target[1]], [target[2]])
+        self._set_target_line([current[0], target[0]], [current[1], target[1]], [current[2], target[2]])
+
+        self._tool_axis.set_segments(_tool_axis_segments(current, _orientation_vector(pose)))
+
+        # Coalesce: status pushes and preview steps landing in the same idle
+        # cycle share one blit.
+        if not self._dirty:
+            self._dirty = True
+            self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        self._dirty = False
+        if self._background is None:
+            self._canvas.draw_idle()
+            return
+        self._canvas.restore_region(self._background)
+        self._draw_animated()
+        self._canvas.blit(self._ax.bbox)
+
+    def _on_canvas_draw(self, _event) -> None:
+        self._background = self._canvas.copy_from_bbox(self._ax.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self) -> None:
+        for artist in (self._target_line, self._arm_line, self._current_point, self._target_point, self._tool_axis):
+            # 3D collections are only projected during a full Axes3D.draw, so
+            # project them here before drawing them on their own.
+            if hasattr(artist, "do_3d_projection"):
+                artist.do_3d_projection()
+            self._draw_artist(artist)
 
     def _refresh_coords(self) -> None:
+        # With the monitor running, let it do the read so the Tk loop never
+        # waits on the serial port; _update_from_status shows the reply.
+        if self.controller.request_coordinate_refresh():
+            self._refresh_requested = True
+            self._response_text.set("Refreshing…")
+            return
         try:
-            response = self.controller.send_command("T06")
-            self.controller.status.coordinates = response
+            response = self.controller.refresh_coordinates()
             self._response_text.set(response)
         except Exception as exc:  # pylint: disable=broad-except
             self._response_text.set(f"Error: {exc}")
@@ -217,8 +343,8 @@ class ArmVisualizerApp:
 
     def _send_motion_command(self, opcode: str) -> None:
         try:
-            coords = {axis: float(entry.get()) for axis, entry in self._entries.items()}
-        except ValueError:
+            coords = {axis: var.get() for axis, var in self._vars.items()}
+        except (tk.TclError, ValueError):
             messagebox.showwarning("Invalid input", "Coordinates must be numeric.")
             return
 
@@ -230,52 +356,45 @@ class ArmVisualizerApp:
             )
             return
 
-        command = (
-            f"{opcode} "
-            f"X{coords['X']} Y{coords['Y']} Z{coords['Z']} "
-            f"A{coords['A']} B{coords['B']} C{coords['C']}"
-        )
+        command = _motion_command(opcode, coords)
         try:
-            response = self.controller.send_command(command)
-            self._response_text.set(response)
-            self._target_pose = (
-                coords["X"],
-                coords["Y"],
-                coords["Z"],
-            )
+            response = self.controller.send_command_bytes(command)
+            self._response_text.set(response.decode("ascii", errors="ignore"))
+            self._target_pose = target
             self._animate_preview()
         except Exception as exc:  # pylint: disable=broad-except
             self._response_text.set(f"Error: {exc}")
 
     def _animate_preview(self) -> None:
-        if not self._target_pose:
-            return
-
         start_pose = self._last_pose or {}
         start = (
             float(start_pose.get("X", 0.0)),
             float(start_pose.get("Y", 0.0)),
             float(start_pose.get("Z", 0.0)),
         )
-        end = self._target_pose
-        steps = 15
-
-        def _step(idx: int) -> None:
-            if not self._running:
-                return
-            t = idx / steps
-            interp = (
-                start[0] + (end[0] - start[0]) * t,
-                start[1] + (end[1] - start[1]) * t,
-                start[2] + (end[2] - start[2]) * t,
-            )
-            pose = dict(start_pose)
-            pose.update({"X": interp[0], "Y": interp[1], "Z": interp[2]})
-            self._draw_points(interp, end, pose)
-            if idx < steps:
-                self.root.after(30, lambda: _step(idx + 1))
-
-        _step(0)
+        # A new move restarts the preview instead of running two chains at once.
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        # One pose dict for the whole preview; each step only overwrites X/Y/Z.
+        self._preview_pose = dict(start_pose)
+        self._preview_rows = iter(np.linspace(start, self._target_pose, _PREVIEW_STEPS + 1))
+        self._preview_tick()
+
+    def _preview_tick(self) -> None:
+        self._preview_job = None
+        if not self._running:
+            return
+        row = next(self._preview_rows, None)
+        if row is None:
+            # Fall back to the last real reading; the monitor only pushes on change.
+            if self._last_pose is not None:
+                self._draw_pose(self._last_pose)
+            return
+        x, y, z = row
+        pose = self._preview_pose
+        pose["X"], pose["Y"], pose["Z"] = x, y, z
+        self._draw_points((x, y, z), self._target_pose, pose)
+        self._preview_job = self.root.after(30, self._preview_tick)
 
     def _on_close(self) -> None:
         self._running = False
@@ -283,17 +402,20 @@ class ArmVisualizerApp:
         self.root.destroy()
 
 
-def _parse_coordinate_line(text: str) -> dict[str, float]:
+def _parse_coordinate_line(text: bytes) -> dict[str, float]:
+    match = _FAST_COORD_RE.search(text)
+    if match:
+        return dict(zip("XYZABC", map(float, match.groups())))
     values: dict[str, float] = {}
     for token in text.split():
-        if token.startswith("RX"):
-            key, value = "A", token[2:]
-        elif token.startswith("RY"):
-            key, value = "B", token[2:]
-        elif token.startswith("RZ"):
-            key, value = "C", token[2:]
+        key = _ROTATION_KEYS.get(token[:2])
+        if key is not None:
+            value = token[2:]
         else:
-            key, value = token[0], token[1:]
+            key = _AXIS_KEYS.get(token[0])
+            if key is None:
+                continue
+            value = token[1:]
         try:
             values[key] = float(value)
         except ValueError:
@@ -301,6 +423,17 @@ def _parse_coordinate_line(text: str) -> dict[str, float]:
     return values
 
 
+def _motion_command(opcode: str, coords: dict[str, float]) -> bytes:
+    """Encode ``<opcode> X.. Y.. Z.. A.. B.. C..`` without an intermediate str."""
+
+    buf = bytearray(opcode.encode("ascii"))
+    for axis, prefix in zip(_AXES, _AXIS_PREFIXES):
+        buf += prefix
+        buf += b"%r" % coords[axis]
+    buf += b"\n"
+    return bytes(buf)
+
+
 def _format_pose(values: dict[str, float], target: tuple[float, float, float] | None) -> str:
     pieces = []
     for key in ("X", "Y", "Z", "A", "B", "C"):
@@ -312,10 +445,14 @@ def _format_pose(values: dict[str, float], target: tuple[float, float, float] |
 
 
 def _orientation_vector(values: dict[str, float]) -> tuple[float, float, float]:
-    from math import cos, radians, sin
+    # Rounded to 0.1° so translation-only moves hit the cache instead of redoing the trig.
+    return _orientation_from_angles(round(values.get("B", 0.0), 1), round(values.get("C", 0.0), 1))
+
 
-    pitch = radians(values.get("B", 0.0))
-    yaw = radians(values.get("C", 0.0))
+@functools.lru_cache(maxsize=256)
+def _orientation_from_angles(pitch_deg: float, yaw_deg: float) -> tuple[float, float, float]:
+    pitch = radians(pitch_deg)
+    yaw = radians(yaw_deg)
 
     x = cos(pitch) * cos(yaw)
     y = cos(pitch) * sin(yaw)
@@ -323,22 +460,51 @@ def _orientation_vector(values: dict[str, float]) -> tuple[float, float, float]:
     return x, y, z
 
 
-def _solve_simple_arm(
-    end_effector: tuple[float, float, float], values: dict[str, float]
-) -> list[tuple[float, float, float]]:
-    from math import atan2, cos, radians, sin, sqrt
+def _tool_axis_segments(
+    start: tuple[float, float, float], direction: tuple[float, float, float], length: float = 60.0
+) -> list[tuple[tuple[float, float, float], tuple[float, float, float]]]:
+    """Shaft and arrowhead segments of a normalized quiver arrow, as ``Axes3D.quiver`` draws it."""
+
+    norm = sqrt(sum(d * d for d in direction)) or 1.0
+    u, v, w = (d / norm for d in direction)
+    tip = (start[0] + length * u, start[1] + length * v, start[2] + length * w)
+
+    # Arrowhead sides: the direction rotated by +/-15° about a horizontal axis perpendicular to it.
+    planar = sqrt(u * u + v * v)
+    xp, yp = (v / planar, -u / planar) if planar else (0.0, 1.0)
+    c, s = cos(radians(15)), sin(radians(15))
+    head = 0.3 * length
+    segments = [(tip, start)]
+    for sign in (1.0, -1.0):
+        hx = (c + xp * xp * (1 - c)) * u + xp * yp * (1 - c) * v + sign * yp * s * w
+        hy = xp * yp * (1 - c) * u + (c + yp * yp * (1 - c)) * v - sign * xp * s * w
+        hz = -sign * yp * s * u + sign * xp * s * v + c * w
+        segments.append((tip, (tip[0] - head * hx, tip[1] - head * hy, tip[2] - head * hz)))
+    return segments
+
 
-    base = (0.0, 0.0, 0.0)
+@functools.lru_cache(maxsize=64)
+def _yaw_terms(yaw_deg: float) -> tuple[float, float]:
+    """``(sin, cos)`` of the yaw angle; constant across a preview, so usually cached."""
 
-    l1, l2, l3 = _link_lengths()
+    yaw = radians(yaw_deg)
+    return sin(yaw), cos(yaw)
+
+
+def _solve_simple_arm(
+    end_effector: tuple[float, float, float], sin_yaw: float, cos_yaw: float, out: np.ndarray
+) -> np.ndarray:
+    """Write base, shoulder, elbow and wrist positions into the rows of ``out`` (shape (4, 3))."""
+
+    l1, l2, l3 = _LINK_LENGTHS
 
     x, y, z = end_effector
-    yaw = radians(values.get("C", 0.0))
 
     planar_dist = sqrt(x * x + y * y)
     total_dist = sqrt(planar_dist * planar_dist + z * z)
     if total_dist < 1e-6:
-        return [base, base, base, base]
+        out.fill(0.0)
+        return out
 
     reachable = min(total_dist - l3, l1 + l2 - 1e-3)
     if reachable < 0:
@@ -366,50 +532,26 @@ def _solve_simple_arm(
     elbow_r = shoulder_r + l2 * cos(shoulder_angle - elbow_angle)
     elbow_z = shoulder_z + l2 * sin(shoulder_angle - elbow_angle)
 
-    sin_yaw, cos_yaw = sin(yaw), cos(yaw)
-
-    shoulder = (shoulder_r * cos_yaw, shoulder_r * sin_yaw, shoulder_z)
-    elbow = (elbow_r * cos_yaw, elbow_r * sin_yaw, elbow_z)
-    wrist = (x - l3 * cos_yaw, y - l3 * sin_yaw, z)
-
-    return [base, shoulder, elbow, wrist]
-
-
-def _link_lengths() -> tuple[float, float, float]:
-    """Nominal link lengths (mm) measured from the home pose."""
-
-    return 140.0, 140.0, 100.0
-
-
-def _home_pose() -> tuple[float, float, float]:
-    """Return the startup position derived from the vertical 90° posture."""
-
-    l1, l2, l3 = _link_lengths()
-    return 0.0, 0.0, l1 + l2 + l3
-
-
-def _max_reach() -> float:
-    """Max reach from base to tool center in any direction (mm)."""
-
-    return sum(_link_lengths())
+    out[0] = 0.0
+    out[1] = shoulder_r * cos_yaw, shoulder_r * sin_yaw, shoulder_z
+    out[2] = elbow_r * cos_yaw, elbow_r * sin_yaw, elbow_z
+    out[3] = x - l3 * cos_yaw, y - l3 * sin_yaw, z
+    return out
 
 
 def _within_workspace(point: tuple[float, float, float]) -> bool:
     """Rough workspace guard to avoid sending impossible targets."""
 
-    from math import sqrt
-
-    reach = _max_reach()
     x, y, z = point
-    radial = sqrt(x * x + y * y)
-    dist = sqrt(radial * radial + z * z)
-    return 0 <= z <= reach and dist <= reach
+    # Compare squared distances; no square roots needed.
+    return 0 <= z <= _MAX_REACH and x * x + y * y + z * z <= _REACH_SQ
 
 
 def parse_arguments(argv: Iterable[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="3D visualizer for the robotic arm")
     parser.add_argument("port", help="Serial port connected to the FT232RL (e.g. COM15)")
     parser.add_argument("--interval", type=float, default=0.5, help="Refresh interval for coordinates (seconds)")
+    parser.add_argument("--dpi", type=int, default=72, help="Plot resolution; lower renders faster (default: 72)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     return parser.parse_args(argv)
 
@@ -419,7 +561,7 @@ def main(argv: Iterable[str] | None = None) -> int:
     setup_logging(args.verbose)
 
     controller = RoboticArmController(port=args.port, coordinate_interval=args.interval)
-    app = ArmVisualizerApp(controller, refresh_ms=int(args.interval * 1000))
+    app = ArmVisualizerApp(controller, dpi=args.dpi)
     app.run()
     return 0
 